@@ -1,37 +1,115 @@
 # main.py - FastAPI Multi-Agent Development Orchestrator
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager, suppress
+from sse_starlette.sse import EventSourceResponse
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Awaitable, Callable
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import json
+import os
+import sys
 import asyncio
+import heapq
+import itertools
+import operator
+from collections import Counter
+import time
 import uuid
 from pathlib import Path
 import logging
+import msgspec
+import numpy as np
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import WatchError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share orchestrator state through Redis when REDIS_URL is configured"""
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url:
+        await orchestrator.attach_store(RedisStateStore(aioredis.from_url(redis_url)))
+    yield
+    if orchestrator.store:
+        await orchestrator.store.close()
+
+
 app = FastAPI(
     title="AI Development Team Orchestrator",
     description="Open-source multi-agent development workflow orchestration",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# CORS middleware for frontend integration
+# CORS middleware for frontend integration; FRONTEND_ORIGIN is a
+# comma-separated allowlist, and preflight results are cached for a day
+frontend_origins = os.environ.get("FRONTEND_ORIGIN", "http://localhost:3000")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[
+        origin.strip() for origin in frontend_origins.split(",") if origin.strip()
+    ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 
+class EventStreamSafeGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves the /events stream uncompressed
+
+    A gzip stream holds bytes back until its buffer fills, which would delay
+    server-sent events indefinitely.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/events":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress the larger JSON payloads (workflows, agents); small ones pass through
+app.add_middleware(EventStreamSafeGZipMiddleware, minimum_size=1024, compresslevel=4)
+
+
+_last_iso_second = None
+_last_iso = ""
+
+
+def _now_iso() -> str:
+    """Current local time as ISO-8601, formatted at most once per second"""
+    global _last_iso_second, _last_iso
+    second = int(time.time())
+    if second != _last_iso_second:
+        _last_iso_second = second
+        _last_iso = datetime.fromtimestamp(second).isoformat()
+    return _last_iso
+
+
+# Compact status encoding for the columnar task store
+STATUS_CODES = {"pending": 0, "in_progress": 1, "completed": 2, "blocked": 3}
+
+# Scheduling rank per priority, lower runs first
+PRIORITY_RANKS = {"high": 0, "medium": 1, "low": 2}
+
+# Registration batches at least this large count unmet dependencies with NumPy
+VECTORIZED_DEPENDENCY_BATCH = 256
+
+
 # Pydantic models for API
 class TaskCreate(BaseModel):
     description: str
@@ -62,7 +140,55 @@ class AgentResponse(BaseModel):
     artifacts: Optional[List[str]] = []
 
 
-@dataclass
+# msgspec mirrors of the POST bodies above: requests are decoded straight into
+# these structs, while the Pydantic models only document the API schema
+class TaskCompleteBody(msgspec.Struct):
+    output: str
+    artifacts: Optional[List[str]] = []
+    next_agent_hint: Optional[str] = None
+
+
+class WorkflowCreateBody(msgspec.Struct):
+    type: str
+    description: str
+    project_context: Optional[Dict[str, Any]] = {}
+
+
+class AgentResponseBody(msgspec.Struct):
+    agent: str
+    analysis: str
+    recommendation: str
+    next_steps: str
+    handoff: Optional[str] = None
+    artifacts: Optional[List[str]] = []
+
+
+def _msgspec_body(struct_type: type) -> Callable:
+    """FastAPI dependency decoding the JSON request body into ``struct_type``"""
+
+    async def decode(request: Request):
+        try:
+            return msgspec.json.decode(await request.body(), type=struct_type)
+        except msgspec.DecodeError as exc:
+            # Same 422 body FastAPI produces for its own validation errors
+            raise RequestValidationError(
+                [{"loc": ("body",), "msg": str(exc), "type": "value_error"}]
+            )
+
+    return decode
+
+
+def _openapi_body(model: type) -> Dict[str, Any]:
+    """Document a msgspec-decoded request body with its Pydantic model"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+@dataclass(slots=True)
 class Task:
     id: str
     description: str
@@ -73,19 +199,64 @@ class Task:
     output: Optional[str] = None
     artifacts: List[str] = None
     metadata: Dict[str, Any] = None
-    created_at: str = datetime.now().isoformat()
+    created_at: str = field(default_factory=_now_iso)
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     estimated_duration: Optional[int] = None  # minutes
+    seq: int = 0  # creation order, used as a stable tiebreak
+    version: int = 0  # bumped on every change, orders replicated updates
+    priority_rank: int = field(init=False, default=1)
 
     def __post_init__(self):
         if self.artifacts is None:
             self.artifacts = []
         if self.metadata is None:
             self.metadata = {}
+        if self.priority not in PRIORITY_RANKS:
+            raise ValueError(f"priority must be one of {list(PRIORITY_RANKS)}")
+        self.priority_rank = PRIORITY_RANKS[self.priority]
+
+    def to_view_dict(self) -> Dict[str, Any]:
+        """Shallow dict view for responses (no deep copy, unlike asdict)"""
+        return {
+            "id": self.id,
+            "description": self.description,
+            "agent": self.agent,
+            "status": self.status,
+            "dependencies": self.dependencies,
+            "priority": self.priority,
+            "output": self.output,
+            "artifacts": self.artifacts,
+            "metadata": self.metadata,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "estimated_duration": self.estimated_duration,
+            "seq": self.seq,
+            "version": self.version,
+        }
+
+
+# Ready-heap entry for a task: (priority_rank, seq, task_id)
+_ready_key = operator.attrgetter("priority_rank", "seq", "id")
+
 
+def _unmet_dependency_counts(
+    status_col: np.ndarray, dep_offsets: np.ndarray, dep_rows: np.ndarray
+) -> np.ndarray:
+    """Count incomplete dependencies per task over a CSR dependency layout
 
-@dataclass
+    Task ``i`` depends on the status-column rows
+    ``dep_rows[dep_offsets[i]:dep_offsets[i + 1]]``.
+    """
+    owners = np.repeat(np.arange(len(dep_offsets) - 1), np.diff(dep_offsets))
+    unmet = status_col[dep_rows] != STATUS_CODES["completed"]
+    return np.bincount(owners, weights=unmet, minlength=len(dep_offsets) - 1).astype(
+        np.int32
+    )
+
+
+@dataclass(slots=True)
 class AgentCapability:
     name: str
     role: str
@@ -100,6 +271,270 @@ class AgentCapability:
             self.tools = []
 
 
+def _encode_hash(record: Dict[str, Any]) -> Dict[str, bytes]:
+    """Encode a record as a Redis hash with one JSON value per field"""
+    return {key: orjson.dumps(value) for key, value in record.items()}
+
+
+def _decode_hash(fields: Dict[bytes, bytes]) -> Dict[str, Any]:
+    """Decode a Redis hash written by _encode_hash"""
+    return {key.decode(): orjson.loads(value) for key, value in fields.items()}
+
+
+class RedisStateStore:
+    """Shares orchestrator state between worker processes through Redis
+
+    Workflows and tasks are persisted as ``workflow:{id}`` and ``task:{id}``
+    hashes, and every change is published so the other workers can apply it
+    to their in-memory scheduling indices. Task writes are compare-and-set on
+    the task version, so concurrent changes from two workers cannot both land.
+    """
+
+    CHANNEL = "devconductor:events"
+    RESUBSCRIBE_DELAY = 1.0  # seconds to wait before resubscribing after a failure
+
+    def __init__(self, redis: aioredis.Redis):
+        self._redis = redis
+        self._origin = uuid.uuid4().hex  # lets a worker skip its own events
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def subscribe(self):
+        """Start buffering change events; call before loading state"""
+        self._pubsub = self._redis.pubsub()
+        await self._pubsub.subscribe(self.CHANNEL)
+
+    def start_listening(
+        self,
+        apply: Callable[[Dict], None],
+        reload: Callable[[], Awaitable[None]],
+    ):
+        """Apply buffered and future change events from other workers
+
+        Events published while the subscription is down are lost, so after
+        resubscribing ``reload`` is awaited to catch up with the stored state.
+        """
+        self._listener = asyncio.create_task(self._listen(apply, reload))
+
+    async def _listen(
+        self,
+        apply: Callable[[Dict], None],
+        reload: Callable[[], Awaitable[None]],
+    ):
+        while True:
+            try:
+                await self._apply_events(apply)
+            except Exception:
+                logger.exception("Lost the state change subscription")
+            await asyncio.sleep(self.RESUBSCRIBE_DELAY)
+            with suppress(Exception):
+                await self._pubsub.aclose()
+            try:
+                await self.subscribe()
+                await reload()
+                logger.info("Resubscribed to state changes")
+            except Exception:
+                logger.exception("Failed to resubscribe to state changes")
+
+    async def _apply_events(self, apply: Callable[[Dict], None]):
+        async for message in self._pubsub.listen():
+            if message["type"] != "message":
+                continue
+            event = orjson.loads(message["data"])
+            if event["origin"] == self._origin:
+                continue
+            try:
+                apply(event)
+            except Exception:
+                logger.exception(f"Failed to apply {event['op']} event")
+
+    async def close(self):
+        if self._listener:
+            self._listener.cancel()
+        if self._pubsub:
+            await self._pubsub.aclose()
+        await self._redis.aclose()
+
+    async def allocate_seqs(self, count: int) -> range:
+        """Reserve ``count`` task sequence numbers shared by all workers"""
+        end = await self._redis.incrby("task_seq", count)
+        return range(end - count, end)
+
+    async def save_workflow(self, workflow: Dict, tasks: List[Task]):
+        views = [task.to_view_dict() for task in tasks]
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(f"workflow:{workflow['id']}", mapping=_encode_hash(workflow))
+            pipe.sadd("workflows", workflow["id"])
+            for view in views:
+                pipe.hset(f"task:{view['id']}", mapping=_encode_hash(view))
+            pipe.publish(
+                self.CHANNEL, self._event("workflow", workflow=workflow, tasks=views)
+            )
+            await pipe.execute()
+
+    async def save_task(self, view: Dict, expected_version: int) -> bool:
+        """Save a task view if the stored task is still at ``expected_version``
+
+        Returns False, writing nothing, when another worker saved it first.
+        """
+        key = f"task:{view['id']}"
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                stored = await pipe.hget(key, "version")
+                if (orjson.loads(stored) if stored else 0) != expected_version:
+                    return False
+                pipe.multi()
+                pipe.hset(key, mapping=_encode_hash(view))
+                pipe.publish(self.CHANNEL, self._event("task", task=view))
+                await pipe.execute()
+            except WatchError:
+                return False
+        return True
+
+    def _event(self, op: str, **payload) -> bytes:
+        return orjson.dumps({"origin": self._origin, "op": op, **payload})
+
+    async def load_workflow(self, workflow_id: str) -> Optional[tuple]:
+        """Load a workflow and its tasks, or None if it was never saved"""
+        fields = await self._redis.hgetall(f"workflow:{workflow_id}")
+        if not fields:
+            return None
+        workflow = _decode_hash(fields)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for task_id in workflow["task_ids"]:
+                pipe.hgetall(f"task:{task_id}")
+            rows = await pipe.execute()
+        return workflow, [Task(**_decode_hash(row)) for row in rows]
+
+    async def load_task(self, task_id: str) -> Optional[Dict]:
+        """Load a task's saved view, or None if it was never saved"""
+        fields = await self._redis.hgetall(f"task:{task_id}")
+        return _decode_hash(fields) if fields else None
+
+    async def load_task_workflow(self, task_id: str) -> Optional[tuple]:
+        """Load the workflow owning a task, or None if the task is unknown"""
+        metadata = await self._redis.hget(f"task:{task_id}", "metadata")
+        if metadata is None:
+            return None
+        return await self.load_workflow(orjson.loads(metadata)["workflow_id"])
+
+    async def load_all(self) -> List[tuple]:
+        """Load every saved workflow with its tasks
+
+        All workflow hashes are read in one pipelined round trip and all of
+        their task hashes in a second, however many workflows are stored.
+        """
+        workflow_ids = await self._redis.smembers("workflows")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for workflow_id in workflow_ids:
+                pipe.hgetall(f"workflow:{workflow_id.decode()}")
+            workflows = [
+                _decode_hash(fields) for fields in await pipe.execute() if fields
+            ]
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for workflow in workflows:
+                for task_id in workflow["task_ids"]:
+                    pipe.hgetall(f"task:{task_id}")
+            rows = iter(await pipe.execute())
+        return [
+            (workflow, [Task(**_decode_hash(next(rows))) for _ in workflow["task_ids"]])
+            for workflow in workflows
+        ]
+
+
+# Structured response formats, one per agent
+PRODUCT_MANAGER_FMT = """
+📋 PRODUCT ANALYSIS
+Business Value: [Revenue/user impact assessment]
+Market Context: [Competitive landscape, user needs]
+User Stories: [As a... I want... So that...]
+Acceptance Criteria: [Specific, testable requirements]
+Success Metrics: [KPIs to measure success]
+Priority: [High/Medium/Low with business justification]
+Dependencies: [What needs to exist first]
+Next Action: [Specific handoff with context]
+"""
+
+ARCHITECT_FMT = """
+🏗️ ARCHITECTURE DESIGN
+System Overview: [High-level architecture diagram description]
+Technology Stack: [Languages, frameworks, databases with rationale]
+Scalability Strategy: [How system handles growth]
+Security Architecture: [Authentication, authorization, data protection]
+API Design: [REST/GraphQL structure and standards]
+Data Architecture: [Database design, data flow, caching strategy]
+Integration Points: [External services, third-party APIs]
+Performance Considerations: [Bottlenecks, optimization strategies]
+Next Action: [Specific handoff with technical context]
+"""
+
+FRONTEND_DEV_FMT = """
+🎨 FRONTEND IMPLEMENTATION
+Component Architecture: [React/Vue component structure]
+State Management: [Redux/Vuex/Context API strategy]
+Styling Strategy: [CSS modules, Tailwind, styled-components approach]
+Responsive Design: [Mobile-first, breakpoint strategy]
+Accessibility: [WCAG compliance, screen reader support]
+Performance: [Bundle optimization, lazy loading, caching]
+Testing Approach: [Unit tests, integration tests, E2E tests]
+Browser Support: [Compatibility requirements and polyfills]
+Next Action: [API requirements, design clarifications needed]
+"""
+
+BACKEND_DEV_FMT = """
+⚡ BACKEND IMPLEMENTATION
+API Endpoints: [REST/GraphQL endpoint specifications]
+Database Schema: [Tables, relationships, indexes, constraints]
+Authentication: [JWT, OAuth, session management strategy]
+Business Logic: [Core algorithms, validation rules, workflows]
+Data Validation: [Input sanitization, schema validation]
+Error Handling: [Exception handling, logging, monitoring]
+Performance: [Query optimization, caching, rate limiting]
+Security: [Input validation, SQL injection prevention, data encryption]
+Next Action: [Frontend API contracts, deployment requirements]
+"""
+
+QA_FMT = """
+🧪 TESTING STRATEGY
+Test Plan: [Comprehensive testing approach]
+Test Cases: [Detailed scenarios with expected outcomes]
+Automation Strategy: [Unit, integration, E2E test automation]
+Performance Tests: [Load testing, stress testing, benchmarks]
+Security Tests: [Vulnerability scanning, penetration testing]
+Usability Tests: [User experience validation]
+Regression Tests: [Change impact validation]
+Bug Tracking: [Issue identification and reporting process]
+Next Action: [Implementation feedback, deployment validation]
+"""
+
+DEVOPS_FMT = """
+🚀 INFRASTRUCTURE & DEPLOYMENT
+Containerization: [Docker strategy, image optimization]
+CI/CD Pipeline: [Build, test, deploy automation]
+Infrastructure: [Cloud provider, resource allocation]
+Monitoring: [Application monitoring, alerting, logging]
+Security: [Infrastructure security, secrets management]
+Backup Strategy: [Data backup, disaster recovery plan]
+Scaling: [Auto-scaling, load balancing strategy]
+Cost Optimization: [Resource efficiency, cost monitoring]
+Next Action: [Application deployment requirements, security validation]
+"""
+
+SECURITY_FMT = """
+🔒 SECURITY ANALYSIS
+Threat Model: [Security risks and attack vectors]
+Vulnerabilities: [Identified security weaknesses]
+Compliance: [GDPR, HIPAA, SOC2 requirements]
+Security Controls: [Authentication, authorization, encryption]
+Data Protection: [PII handling, data classification, retention]
+Incident Response: [Security breach response plan]
+Audit Trail: [Logging, monitoring, forensic capabilities]
+Recommendations: [Security improvements and best practices]
+Next Action: [Implementation requirements, ongoing monitoring]
+"""
+
+
 class DevelopmentOrchestrator:
     def __init__(self):
         self.tasks: Dict[str, Task] = {}
@@ -107,6 +542,39 @@ class DevelopmentOrchestrator:
         self.agents = self._initialize_agents()
         self.workflow_templates = self._initialize_workflow_templates()
         self.active_sessions: Dict[str, str] = {}  # session_id -> current_task_id
+        self.store: Optional[RedisStateStore] = None
+        # Task events for unknown tasks held back while read-through loads run
+        self._loads_in_flight = 0
+        self._deferred_events: List[Dict] = []
+        self._serialize_static_payloads()
+
+        # Every (agent, workflow type) estimate, computed once
+        self._duration_table: Dict[tuple, int] = {
+            (agent, workflow_type): self._estimate_task_duration(agent, workflow_type)
+            for agent in self.agents
+            for workflow_type in self.workflow_templates
+        }
+
+        # Incremental scheduling state: dependents fan-out, unmet dependency
+        # counts, and a heap of (priority_rank, seq, task_id) for ready tasks
+        self._dependents: Dict[str, List[str]] = {}
+        self._indegree: Dict[str, int] = {}
+        self._released: set = set()  # completed tasks whose dependents were released
+        self._ready: List[tuple] = []
+        self._ready_stale = 0  # heap entries whose task is no longer pending
+        self._task_seq = itertools.count()
+        self._status_counts = Counter(
+            {"pending": 0, "in_progress": 0, "completed": 0, "blocked": 0}
+        )
+
+        # Columnar mirror of task status for aggregate queries: task_id -> row,
+        # an int8 status column grown by doubling, and each workflow's row span
+        self._task_index: Dict[str, int] = {}
+        self._status_col = np.zeros(1024, dtype=np.int8)
+        self._workflow_rows: Dict[str, slice] = {}
+
+        # Replaced after every set so each waiter sees exactly one wake-up
+        self._state_changed = asyncio.Event()
 
     def _initialize_agents(self) -> Dict[str, AgentCapability]:
         """Initialize all development team agents with enhanced capabilities"""
@@ -131,17 +599,7 @@ class DevelopmentOrchestrator:
                     "no infrastructure choices",
                 ],
                 tools=["user research templates", "priority matrices", "story mapping"],
-                output_format="""
-📋 PRODUCT ANALYSIS
-Business Value: [Revenue/user impact assessment]
-Market Context: [Competitive landscape, user needs]
-User Stories: [As a... I want... So that...]
-Acceptance Criteria: [Specific, testable requirements]
-Success Metrics: [KPIs to measure success]
-Priority: [High/Medium/Low with business justification]
-Dependencies: [What needs to exist first]
-Next Action: [Specific handoff with context]
-""",
+                output_format=PRODUCT_MANAGER_FMT,
             ),
             "architect": AgentCapability(
                 name="architect",
@@ -168,18 +626,7 @@ Next Action: [Specific handoff with context]
                     "tech stack evaluation",
                     "performance modeling",
                 ],
-                output_format="""
-🏗️ ARCHITECTURE DESIGN
-System Overview: [High-level architecture diagram description]
-Technology Stack: [Languages, frameworks, databases with rationale]
-Scalability Strategy: [How system handles growth]
-Security Architecture: [Authentication, authorization, data protection]
-API Design: [REST/GraphQL structure and standards]
-Data Architecture: [Database design, data flow, caching strategy]
-Integration Points: [External services, third-party APIs]
-Performance Considerations: [Bottlenecks, optimization strategies]
-Next Action: [Specific handoff with technical context]
-""",
+                output_format=ARCHITECT_FMT,
             ),
             "frontend-dev": AgentCapability(
                 name="frontend-dev",
@@ -202,18 +649,7 @@ Next Action: [Specific handoff with technical context]
                     "no business requirements definition",
                 ],
                 tools=["component libraries", "bundlers", "testing frameworks"],
-                output_format="""
-🎨 FRONTEND IMPLEMENTATION
-Component Architecture: [React/Vue component structure]
-State Management: [Redux/Vuex/Context API strategy]
-Styling Strategy: [CSS modules, Tailwind, styled-components approach]
-Responsive Design: [Mobile-first, breakpoint strategy]
-Accessibility: [WCAG compliance, screen reader support]
-Performance: [Bundle optimization, lazy loading, caching]
-Testing Approach: [Unit tests, integration tests, E2E tests]
-Browser Support: [Compatibility requirements and polyfills]
-Next Action: [API requirements, design clarifications needed]
-""",
+                output_format=FRONTEND_DEV_FMT,
             ),
             "backend-dev": AgentCapability(
                 name="backend-dev",
@@ -236,18 +672,7 @@ Next Action: [API requirements, design clarifications needed]
                     "no infrastructure provisioning",
                 ],
                 tools=["API frameworks", "database ORMs", "testing suites"],
-                output_format="""
-⚡ BACKEND IMPLEMENTATION
-API Endpoints: [REST/GraphQL endpoint specifications]
-Database Schema: [Tables, relationships, indexes, constraints]
-Authentication: [JWT, OAuth, session management strategy]
-Business Logic: [Core algorithms, validation rules, workflows]
-Data Validation: [Input sanitization, schema validation]
-Error Handling: [Exception handling, logging, monitoring]
-Performance: [Query optimization, caching, rate limiting]
-Security: [Input validation, SQL injection prevention, data encryption]
-Next Action: [Frontend API contracts, deployment requirements]
-""",
+                output_format=BACKEND_DEV_FMT,
             ),
             "qa": AgentCapability(
                 name="qa",
@@ -270,18 +695,7 @@ Next Action: [Frontend API contracts, deployment requirements]
                     "no business priority setting",
                 ],
                 tools=["testing frameworks", "automation tools", "performance testing"],
-                output_format="""
-🧪 TESTING STRATEGY
-Test Plan: [Comprehensive testing approach]
-Test Cases: [Detailed scenarios with expected outcomes]
-Automation Strategy: [Unit, integration, E2E test automation]
-Performance Tests: [Load testing, stress testing, benchmarks]
-Security Tests: [Vulnerability scanning, penetration testing]
-Usability Tests: [User experience validation]
-Regression Tests: [Change impact validation]
-Bug Tracking: [Issue identification and reporting process]
-Next Action: [Implementation feedback, deployment validation]
-""",
+                output_format=QA_FMT,
             ),
             "devops": AgentCapability(
                 name="devops",
@@ -303,18 +717,7 @@ Next Action: [Implementation feedback, deployment validation]
                     "no UI/UX decisions",
                 ],
                 tools=["Docker", "Kubernetes", "CI/CD tools", "monitoring systems"],
-                output_format="""
-🚀 INFRASTRUCTURE & DEPLOYMENT
-Containerization: [Docker strategy, image optimization]
-CI/CD Pipeline: [Build, test, deploy automation]
-Infrastructure: [Cloud provider, resource allocation]
-Monitoring: [Application monitoring, alerting, logging]
-Security: [Infrastructure security, secrets management]
-Backup Strategy: [Data backup, disaster recovery plan]
-Scaling: [Auto-scaling, load balancing strategy]
-Cost Optimization: [Resource efficiency, cost monitoring]
-Next Action: [Application deployment requirements, security validation]
-""",
+                output_format=DEVOPS_FMT,
             ),
             "security": AgentCapability(
                 name="security",
@@ -337,73 +740,131 @@ Next Action: [Application deployment requirements, security validation]
                     "no infrastructure provisioning",
                 ],
                 tools=["security scanners", "audit tools", "compliance frameworks"],
-                output_format="""
-🔒 SECURITY ANALYSIS
-Threat Model: [Security risks and attack vectors]
-Vulnerabilities: [Identified security weaknesses]
-Compliance: [GDPR, HIPAA, SOC2 requirements]
-Security Controls: [Authentication, authorization, encryption]
-Data Protection: [PII handling, data classification, retention]
-Incident Response: [Security breach response plan]
-Audit Trail: [Logging, monitoring, forensic capabilities]
-Recommendations: [Security improvements and best practices]
-Next Action: [Implementation requirements, ongoing monitoring]
-""",
+                output_format=SECURITY_FMT,
             ),
         }
 
-    def _initialize_workflow_templates(self) -> Dict[str, List[str]]:
-        """Enhanced workflow templates for different development scenarios"""
+    def _initialize_workflow_templates(self) -> Dict[str, Dict[str, Any]]:
+        """Enhanced workflow templates for different development scenarios
+
+        Each template lists its agent steps and a dependency DAG of
+        (upstream, downstream) step indices; upstream always precedes downstream.
+        """
         return {
-            "new-feature": [
-                "product-manager",  # Requirements & user impact
-                "architect",  # Technical design & feasibility
-                "security",  # Security implications
-                "frontend-dev",  # UI implementation plan
-                "backend-dev",  # API & business logic
-                "qa",  # Testing strategy
-                "devops",  # Deployment planning
-            ],
-            "mvp-development": [
-                "product-manager",  # Core feature identification
-                "architect",  # MVP architecture design
-                "security",  # Essential security requirements
-                "backend-dev",  # Core API development
-                "frontend-dev",  # Essential UI components
-                "devops",  # Basic infrastructure
-                "qa",  # MVP testing strategy
-            ],
-            "bug-fix": [
-                "qa",  # Bug reproduction & root cause
-                "backend-dev",  # Server-side investigation
-                "frontend-dev",  # Client-side investigation
-                "security",  # Security impact assessment
-                "qa",  # Fix validation
-                "devops",  # Deployment coordination
-            ],
-            "performance-optimization": [
-                "architect",  # Performance bottleneck analysis
-                "backend-dev",  # Database & API optimization
-                "frontend-dev",  # Client-side optimization
-                "devops",  # Infrastructure optimization
-                "qa",  # Performance testing validation
-            ],
-            "security-audit": [
-                "security",  # Comprehensive security assessment
-                "architect",  # Architecture security review
-                "backend-dev",  # Code security analysis
-                "devops",  # Infrastructure security review
-                "qa",  # Security testing validation
-            ],
-            "refactoring": [
-                "architect",  # Refactoring strategy & design
-                "backend-dev",  # Server-side refactoring
-                "frontend-dev",  # Client-side refactoring
-                "qa",  # Regression testing
-                "devops",  # Deployment impact assessment
-            ],
+            "new-feature": {
+                "agents": [
+                    "product-manager",  # 0: Requirements & user impact
+                    "architect",  # 1: Technical design & feasibility
+                    "security",  # 2: Security implications
+                    "frontend-dev",  # 3: UI implementation plan
+                    "backend-dev",  # 4: API & business logic
+                    "qa",  # 5: Testing strategy
+                    "devops",  # 6: Deployment planning
+                ],
+                "dag": [(0, 1), (1, 2), (1, 3), (2, 4), (3, 5), (4, 5), (5, 6)],
+            },
+            "mvp-development": {
+                "agents": [
+                    "product-manager",  # 0: Core feature identification
+                    "architect",  # 1: MVP architecture design
+                    "security",  # 2: Essential security requirements
+                    "backend-dev",  # 3: Core API development
+                    "frontend-dev",  # 4: Essential UI components
+                    "devops",  # 5: Basic infrastructure
+                    "qa",  # 6: MVP testing strategy
+                ],
+                "dag": [
+                    (0, 1),
+                    (1, 2),
+                    (2, 3),
+                    (1, 4),
+                    (1, 5),
+                    (3, 6),
+                    (4, 6),
+                    (5, 6),
+                ],
+            },
+            "bug-fix": {
+                "agents": [
+                    "qa",  # 0: Bug reproduction & root cause
+                    "backend-dev",  # 1: Server-side investigation
+                    "frontend-dev",  # 2: Client-side investigation
+                    "security",  # 3: Security impact assessment
+                    "qa",  # 4: Fix validation
+                    "devops",  # 5: Deployment coordination
+                ],
+                "dag": [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (4, 5)],
+            },
+            "performance-optimization": {
+                "agents": [
+                    "architect",  # 0: Performance bottleneck analysis
+                    "backend-dev",  # 1: Database & API optimization
+                    "frontend-dev",  # 2: Client-side optimization
+                    "devops",  # 3: Infrastructure optimization
+                    "qa",  # 4: Performance testing validation
+                ],
+                "dag": [(0, 1), (0, 2), (0, 3), (1, 4), (2, 4), (3, 4)],
+            },
+            "security-audit": {
+                "agents": [
+                    "security",  # 0: Comprehensive security assessment
+                    "architect",  # 1: Architecture security review
+                    "backend-dev",  # 2: Code security analysis
+                    "devops",  # 3: Infrastructure security review
+                    "qa",  # 4: Security testing validation
+                ],
+                "dag": [(0, 1), (1, 2), (1, 3), (2, 4), (3, 4)],
+            },
+            "refactoring": {
+                "agents": [
+                    "architect",  # 0: Refactoring strategy & design
+                    "backend-dev",  # 1: Server-side refactoring
+                    "frontend-dev",  # 2: Client-side refactoring
+                    "qa",  # 3: Regression testing
+                    "devops",  # 4: Deployment impact assessment
+                ],
+                "dag": [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)],
+            },
         }
 
+    def _serialize_static_payloads(self):
+        """Pre-serialize responses over config that never changes after startup"""
+        self._root_json = orjson.dumps(
+            {
+                "message": "AI Development Team Orchestrator",
+                "version": "1.0.0",
+                "status": "active",
+                "available_workflows": list(self.workflow_templates.keys()),
+                "active_agents": len(self.agents),
+            }
+        )
+        self._agents_json = orjson.dumps(
+            {name: asdict(agent) for name, agent in self.agents.items()}
+        )
+        self._agent_json = {
+            name: orjson.dumps(asdict(agent)) for name, agent in self.agents.items()
+        }
+        self._templates_json = orjson.dumps(
+            {
+                "templates": {
+                    name: template["agents"]
+                    for name, template in self.workflow_templates.items()
+                },
+                "dags": {
+                    name: template["dag"]
+                    for name, template in self.workflow_templates.items()
+                },
+                "descriptions": {
+                    "new-feature": "Complete feature development from requirements to deployment",
+                    "mvp-development": "Minimal Viable Product development workflow",
+                    "bug-fix": "Bug investigation, fixing, and validation workflow",
+                    "performance-optimization": "System performance analysis and optimization",
+                    "security-audit": "Comprehensive security assessment and remediation",
+                    "refactoring": "Code refactoring with proper testing and validation",
+                },
+            }
+        )
+
     async def create_workflow(
         self,
         workflow_type: str,
@@ -417,52 +878,61 @@ Next Action: [Implementation requirements, ongoing monitoring]
             )
 
         workflow_id = str(uuid.uuid4())
-        workflow = self.workflow_templates[workflow_type]
-        task_ids = []
+        template = self.workflow_templates[workflow_type]
+        agents = template["agents"]
+        upstream: Dict[int, List[int]] = {i: [] for i in range(len(agents))}
+        for src, dst in template["dag"]:
+            upstream[dst].append(src)
+        seqs = (
+            await self.store.allocate_seqs(len(agents))
+            if self.store
+            else [next(self._task_seq) for _ in agents]
+        )
+        task_ids = [str(uuid.uuid4()) for _ in agents]
+        tasks = []
 
         # Create tasks for the workflow
-        for i, agent in enumerate(workflow):
-            task_id = str(uuid.uuid4())
-            dependencies = [task_ids[-1]] if i > 0 else []
-
+        for i, agent in enumerate(agents):
             # Estimate duration based on agent type and complexity
-            estimated_duration = self._estimate_task_duration(agent, workflow_type)
-
-            task = Task(
-                id=task_id,
-                description=f"{agent}: {description}",
-                agent=agent,
-                status="pending",
-                dependencies=dependencies,
-                estimated_duration=estimated_duration,
-                metadata={
-                    "workflow_id": workflow_id,
-                    "workflow_type": workflow_type,
-                    "project_context": project_context or {},
-                },
+            estimated_duration = self._duration_table[(agent, workflow_type)]
+
+            tasks.append(
+                Task(
+                    id=task_ids[i],
+                    description=f"{agent}: {description}",
+                    agent=agent,
+                    status="pending",
+                    dependencies=[task_ids[j] for j in upstream[i]],
+                    estimated_duration=estimated_duration,
+                    seq=seqs[i],
+                    metadata={
+                        "workflow_id": workflow_id,
+                        "workflow_type": workflow_type,
+                        "project_context": project_context or {},
+                    },
+                )
             )
 
-            self.tasks[task_id] = task
-            task_ids.append(task_id)
-
         # Store workflow metadata
-        self.workflows[workflow_id] = {
+        workflow = {
             "id": workflow_id,
             "type": workflow_type,
             "description": description,
             "task_ids": task_ids,
-            "created_at": datetime.now().isoformat(),
+            "created_at": _now_iso(),
             "status": "active",
             "project_context": project_context or {},
         }
+        self._register_workflow(workflow, tasks)
+        if self.store:
+            await self.store.save_workflow(workflow, tasks)
 
         logger.info(f"Created workflow {workflow_type} with {len(task_ids)} tasks")
+        next_tasks = self.get_next_tasks(limit=1)
         return {
             "workflow_id": workflow_id,
             "task_ids": task_ids,
-            "next_task": asdict(self.get_next_tasks()[0])
-            if self.get_next_tasks()
-            else None,
+            "next_task": next_tasks[0].to_view_dict() if next_tasks else None,
         }
 
     def _estimate_task_duration(self, agent: str, workflow_type: str) -> int:
@@ -490,44 +960,261 @@ Next Action: [Implementation requirements, ongoing monitoring]
         multiplier = complexity_multipliers.get(workflow_type, 1.0)
         return int(base * multiplier)
 
-    def get_next_tasks(self) -> List[Task]:
-        """Get tasks ready for execution"""
-        ready_tasks = []
+    def _register_workflow(self, workflow: Dict, tasks: List[Task]):
+        """Index a workflow's tasks for scheduling; tasks may be in any status"""
+        self._register_workflows([(workflow, tasks)])
 
-        for task in self.tasks.values():
-            if task.status != "pending":
+    def _register_workflows(self, loaded: List[tuple]):
+        """Index (workflow, tasks) pairs not yet known to this orchestrator"""
+        new_tasks = []
+        for workflow, tasks in loaded:
+            if workflow["id"] in self.workflows:
                 continue
-
-            # Check dependencies
-            deps_completed = all(
-                self.tasks.get(dep_id, Task("", "", "", "", "completed")).status
-                == "completed"
-                for dep_id in task.dependencies
+            first_row = len(self._task_index)
+            for task in tasks:
+                self.tasks[task.id] = task
+                self._add_task_row(task)
+                self._status_counts[task.status] += 1
+                self._dependents[task.id] = []
+                if task.status == "completed":
+                    self._released.add(task.id)
+            self._workflow_rows[workflow["id"]] = slice(
+                first_row, len(self._task_index)
             )
-
-            if deps_completed:
-                ready_tasks.append(task)
-
-        # Sort by priority and creation time
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        ready_tasks.sort(
-            key=lambda t: (priority_order.get(t.priority, 1), t.created_at)
+            self.workflows[workflow["id"]] = workflow
+            new_tasks.extend(tasks)
+
+        for task, unmet in zip(new_tasks, self._count_unmet_dependencies(new_tasks)):
+            self._indegree[task.id] = unmet
+            for dep_id in task.dependencies:
+                self._dependents[dep_id].append(task.id)
+            if task.status == "pending" and unmet == 0:
+                self._push_ready(task)
+
+        if new_tasks:
+            self._notify_state_changed()
+
+    def _count_unmet_dependencies(self, tasks: List[Task]) -> List[int]:
+        """Count each task's dependencies that are not completed yet"""
+        # A single new workflow is cheaper to check in plain Python
+        if len(tasks) < VECTORIZED_DEPENDENCY_BATCH:
+            return [
+                sum(
+                    self.tasks[dep_id].status != "completed"
+                    for dep_id in task.dependencies
+                )
+                for task in tasks
+            ]
+
+        # Bulk loads check every dependency edge against the status column
+        dep_offsets = np.zeros(len(tasks) + 1, dtype=np.int32)
+        np.cumsum([len(task.dependencies) for task in tasks], out=dep_offsets[1:])
+        dep_rows = np.fromiter(
+            (
+                self._task_index[dep_id]
+                for task in tasks
+                for dep_id in task.dependencies
+            ),
+            dtype=np.int32,
+            count=dep_offsets[-1],
         )
-
-        return ready_tasks
+        return _unmet_dependency_counts(
+            self._status_col, dep_offsets, dep_rows
+        ).tolist()
+
+    async def attach_store(self, store: RedisStateStore):
+        """Load shared state from ``store`` and follow other workers' changes"""
+        await store.subscribe()
+        self._register_workflows(await store.load_all())
+        self.store = store
+        store.start_listening(self.apply_event, self._reload_from_store)
+        logger.info(f"Loaded {len(self.workflows)} workflows from shared store")
+
+    async def _reload_from_store(self):
+        """Catch up with the shared store after missing change events"""
+        loaded = await self.store.load_all()
+        for workflow, tasks in loaded:
+            if workflow["id"] in self.workflows:
+                for task in tasks:
+                    self._apply_task_view(self.tasks[task.id], task.to_view_dict())
+        self._register_workflows(loaded)
+
+    def apply_event(self, event: Dict):
+        """Apply a state change published by another worker"""
+        if event["op"] == "workflow":
+            self._register_workflow(
+                event["workflow"], [Task(**view) for view in event["tasks"]]
+            )
+        elif event["op"] == "task":
+            task = self.tasks.get(event["task"]["id"])
+            if task is None:
+                # Fetched on demand by find_task; a load already in flight may
+                # return a snapshot older than this event, so keep it for then
+                if self._loads_in_flight:
+                    self._deferred_events.append(event)
+                return
+            self._apply_task_view(task, event["task"])
+
+    def _apply_task_view(self, task: Task, view: Dict):
+        """Bring a task up to a saved view, ignoring views it already reflects
+
+        Events buffered while state was loading, or arriving after a
+        read-through load, replay changes the loaded task already has; their
+        version is at or below the task's and they are dropped.
+        """
+        if view["version"] <= task.version:
+            return
+        if task.status == "completed" and view["status"] != "completed":
+            logger.warning(f"Ignoring {view['status']} for completed task {task.id}")
+            return
+        task.version = view["version"]
+        task.output = view["output"]
+        task.artifacts = view["artifacts"]
+        task.started_at = view["started_at"]
+        task.completed_at = view["completed_at"]
+        if view["status"] != task.status:
+            self._set_status(task, view["status"])
+
+    async def find_task(self, task_id: str) -> Optional[Task]:
+        """Look up a task, loading it from the shared store if it is not local"""
+        if task_id not in self.tasks and self.store:
+            await self._load_through(self.store.load_task_workflow(task_id))
+        return self.tasks.get(task_id)
+
+    async def find_workflow(self, workflow_id: str) -> Optional[Dict]:
+        """Look up a workflow, loading it from the shared store if it is not local"""
+        if workflow_id not in self.workflows and self.store:
+            await self._load_through(self.store.load_workflow(workflow_id))
+        return self.workflows.get(workflow_id)
+
+    async def _load_through(self, load: Awaitable[Optional[tuple]]):
+        """Register a workflow loaded from the shared store on a local miss
+
+        Task events that arrived during the load are applied on top of the
+        loaded snapshot; those for tasks still unknown stay deferred while
+        other loads are in flight.
+        """
+        self._loads_in_flight += 1
+        try:
+            loaded = await load
+        finally:
+            self._loads_in_flight -= 1
+        if loaded:
+            self._register_workflow(*loaded)
+        deferred, self._deferred_events = self._deferred_events, []
+        for event in deferred:
+            self.apply_event(event)
+
+    async def _update_task(self, task: Task, status: str, **changes):
+        """Change a task locally and write the change through to the shared store
+
+        Raises a 409, writing nothing, for a change that would move a task out
+        of completed, and when another worker changed the task first; the task
+        is then refreshed with that worker's change instead.
+        """
+        if task.status == "completed" and status != "completed":
+            raise HTTPException(status_code=409, detail="Task is already completed")
+        view = {
+            **task.to_view_dict(),
+            **changes,
+            "status": status,
+            "version": task.version + 1,
+        }
+        if self.store and not await self.store.save_task(view, task.version):
+            latest = await self.store.load_task(task.id)
+            if latest:
+                self._apply_task_view(task, latest)
+            raise HTTPException(
+                status_code=409, detail="Task was updated by another worker"
+            )
+        self._apply_task_view(task, view)
+
+    def _push_ready(self, task: Task):
+        """Queue a task whose dependencies are all completed"""
+        heapq.heappush(self._ready, _ready_key(task))
+
+    def _add_task_row(self, task: Task):
+        """Assign a task the next row in the status column"""
+        row = len(self._task_index)
+        if row == len(self._status_col):
+            grown = np.zeros(2 * row, dtype=np.int8)
+            grown[:row] = self._status_col
+            self._status_col = grown
+        self._status_col[row] = STATUS_CODES[task.status]
+        self._task_index[task.id] = row
+
+    def _set_status(self, task: Task, status: str):
+        """Transition a task's status, keeping counters and the ready queue in sync"""
+        previous = task.status
+        if previous == "pending" and self._indegree[task.id] == 0:
+            self._ready_stale += 1  # its ready-heap entry goes stale
+        self._status_counts[previous] -= 1
+        task.status = status
+        self._status_counts[status] += 1
+        self._status_col[self._task_index[task.id]] = STATUS_CODES[status]
+
+        # Release dependents whose last outstanding dependency just completed;
+        # a task releases them only once however often it is completed
+        if status == "completed" and task.id not in self._released:
+            self._released.add(task.id)
+            for dep_id in self._dependents[task.id]:
+                self._indegree[dep_id] -= 1
+                dependent = self.tasks[dep_id]
+                if self._indegree[dep_id] == 0 and dependent.status == "pending":
+                    self._push_ready(dependent)
+
+        self._notify_state_changed()
+
+    def _notify_state_changed(self):
+        """Wake everything waiting on the current state-change event"""
+        self._state_changed.set()
+        self._state_changed = asyncio.Event()
+
+    def get_next_tasks(self, limit: Optional[int] = None) -> List[Task]:
+        """Get tasks ready for execution, optionally only the best ``limit``"""
+        # Drop heap entries for tasks that left the pending state
+        while self._ready and self.tasks[self._ready[0][2]].status != "pending":
+            heapq.heappop(self._ready)
+            self._ready_stale -= 1
+
+        if limit is None:
+            # A full read walks the whole heap anyway, so always prune
+            # entries whose task is no longer pending rather than trusting
+            # the stale counter; a sorted list is itself a valid heap
+            self._ready = [
+                entry
+                for entry in self._ready
+                if self.tasks[entry[2]].status == "pending"
+            ]
+            self._ready_stale = 0
+            self._ready.sort()
+            return [self.tasks[task_id] for _, _, task_id in self._ready]
+
+        # Over-fetch by the stale entries still buried in the heap so a
+        # limited read stays complete
+        entries = heapq.nsmallest(limit + self._ready_stale, self._ready)
+        ready_tasks = [
+            self.tasks[task_id]
+            for _, _, task_id in entries
+            if self.tasks[task_id].status == "pending"
+        ]
+        return ready_tasks[:limit]
 
     async def complete_task(
         self, task_id: str, output: str, artifacts: List[str] = None
     ) -> Dict:
         """Complete a task and advance workflow"""
-        if task_id not in self.tasks:
+        task = await self.find_task(task_id)
+        if task is None:
             raise HTTPException(status_code=404, detail="Task not found")
 
-        task = self.tasks[task_id]
-        task.status = "completed"
-        task.output = output
-        task.completed_at = datetime.now().isoformat()
-        task.artifacts = artifacts or []
+        await self._update_task(
+            task,
+            "completed",
+            output=output,
+            completed_at=_now_iso(),
+            artifacts=artifacts or [],
+        )
 
         logger.info(f"Completed task {task_id} for agent {task.agent}")
 
@@ -536,27 +1223,74 @@ Next Action: [Implementation requirements, ongoing monitoring]
 
         return {
             "task_completed": True,
-            "completed_task": asdict(task),
-            "next_tasks": [asdict(t) for t in next_tasks],
+            "completed_task": task.to_view_dict(),
+            "next_tasks": [next_task.to_view_dict() for next_task in next_tasks],
             "workflow_progress": self._calculate_workflow_progress(
                 task.metadata.get("workflow_id")
             ),
         }
 
+    async def _execute_task(
+        self, task: Task, executor: Callable[[Task], Awaitable[str]]
+    ) -> str:
+        """Run a single task through the executor, tracking its state"""
+        await self._update_task(task, "in_progress", started_at=_now_iso())
+        try:
+            return await executor(task)
+        except Exception:
+            logger.exception(f"Task {task.id} for agent {task.agent} failed")
+            # Surface the executor's failure even if recording it does not land
+            try:
+                await self._update_task(task, "blocked")
+            except Exception:
+                logger.exception(f"Could not mark task {task.id} blocked")
+            raise
+
+    async def run_workflow(
+        self, workflow_id: str, executor: Callable[[Task], Awaitable[str]]
+    ) -> Dict:
+        """Execute a workflow layer by layer, running independent tasks concurrently
+
+        ``executor`` is awaited with each ready task and returns its output.
+        """
+        if await self.find_workflow(workflow_id) is None:
+            raise HTTPException(status_code=404, detail="Workflow not found")
+
+        while True:
+            layer = [
+                task
+                for task in self.get_next_tasks()
+                if task.metadata.get("workflow_id") == workflow_id
+            ]
+            if not layer:
+                break
+
+            # Let the whole layer finish so siblings of a failed task still
+            # get their outputs recorded, then surface the first failure
+            outputs = await asyncio.gather(
+                *(self._execute_task(task, executor) for task in layer),
+                return_exceptions=True,
+            )
+            failures = []
+            for task, output in zip(layer, outputs):
+                if isinstance(output, BaseException):
+                    failures.append(output)
+                else:
+                    await self.complete_task(task.id, output)
+            if failures:
+                raise failures[0]
+
+        return self._calculate_workflow_progress(workflow_id)
+
     def _calculate_workflow_progress(self, workflow_id: str) -> Dict:
         """Calculate progress for a specific workflow"""
         if not workflow_id or workflow_id not in self.workflows:
             return {}
 
-        workflow = self.workflows[workflow_id]
-        task_ids = workflow["task_ids"]
+        rows = self._status_col[self._workflow_rows[workflow_id]]
 
-        total_tasks = len(task_ids)
-        completed_tasks = sum(
-            1
-            for task_id in task_ids
-            if self.tasks.get(task_id, Task("", "", "", "", "")).status == "completed"
-        )
+        total_tasks = len(rows)
+        completed_tasks = int(np.count_nonzero(rows == STATUS_CODES["completed"]))
 
         return {
             "workflow_id": workflow_id,
@@ -575,17 +1309,13 @@ orchestrator = DevelopmentOrchestrator()
 # API Endpoints
 @app.get("/")
 async def root():
-    return {
-        "message": "AI Development Team Orchestrator",
-        "version": "1.0.0",
-        "status": "active",
-        "available_workflows": list(orchestrator.workflow_templates.keys()),
-        "active_agents": len(orchestrator.agents),
-    }
+    return Response(orchestrator._root_json, media_type="application/json")
 
 
-@app.post("/workflows")
-async def create_workflow(workflow: WorkflowCreate):
+@app.post("/workflows", openapi_extra=_openapi_body(WorkflowCreate))
+async def create_workflow(
+    workflow: WorkflowCreateBody = Depends(_msgspec_body(WorkflowCreateBody)),
+):
     """Create a new development workflow"""
     result = await orchestrator.create_workflow(
         workflow.type, workflow.description, workflow.project_context
@@ -602,15 +1332,15 @@ async def list_workflows():
 @app.get("/workflows/{workflow_id}")
 async def get_workflow(workflow_id: str):
     """Get specific workflow details"""
-    if workflow_id not in orchestrator.workflows:
+    workflow = await orchestrator.find_workflow(workflow_id)
+    if workflow is None:
         raise HTTPException(status_code=404, detail="Workflow not found")
 
-    workflow = orchestrator.workflows[workflow_id]
     tasks = [orchestrator.tasks[task_id] for task_id in workflow["task_ids"]]
 
     return {
         **workflow,
-        "tasks": [asdict(task) for task in tasks],
+        "tasks": [task.to_view_dict() for task in tasks],
         "progress": orchestrator._calculate_workflow_progress(workflow_id),
     }
 
@@ -619,11 +1349,14 @@ async def get_workflow(workflow_id: str):
 async def get_next_tasks():
     """Get next ready tasks across all workflows"""
     ready_tasks = orchestrator.get_next_tasks()
-    return [asdict(task) for task in ready_tasks]
+    return [task.to_view_dict() for task in ready_tasks]
 
 
-@app.post("/tasks/{task_id}/complete")
-async def complete_task(task_id: str, completion: TaskComplete):
+@app.post("/tasks/{task_id}/complete", openapi_extra=_openapi_body(TaskComplete))
+async def complete_task(
+    task_id: str,
+    completion: TaskCompleteBody = Depends(_msgspec_body(TaskCompleteBody)),
+):
     """Complete a specific task"""
     result = await orchestrator.complete_task(
         task_id, completion.output, completion.artifacts
@@ -634,18 +1367,17 @@ async def complete_task(task_id: str, completion: TaskComplete):
 @app.get("/tasks/{task_id}")
 async def get_task(task_id: str):
     """Get specific task details"""
-    if task_id not in orchestrator.tasks:
+    task = await orchestrator.find_task(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return asdict(orchestrator.tasks[task_id])
+    return task.to_view_dict()
 
 
 @app.get("/agents")
 async def get_agents():
     """Get all available agents and their capabilities"""
-    return {
-        agent_name: asdict(agent) for agent_name, agent in orchestrator.agents.items()
-    }
+    return Response(orchestrator._agents_json, media_type="application/json")
 
 
 @app.get("/agents/{agent_name}")
@@ -654,11 +1386,14 @@ async def get_agent(agent_name: str):
     if agent_name not in orchestrator.agents:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    return asdict(orchestrator.agents[agent_name])
+    return Response(orchestrator._agent_json[agent_name], media_type="application/json")
 
 
-@app.post("/agents/{agent_name}/response")
-async def log_agent_response(agent_name: str, response: AgentResponse):
+@app.post("/agents/{agent_name}/response", openapi_extra=_openapi_body(AgentResponse))
+async def log_agent_response(
+    agent_name: str,
+    response: AgentResponseBody = Depends(_msgspec_body(AgentResponseBody)),
+):
     """Log an agent response for workflow tracking"""
     # This endpoint allows Cursor to log agent responses
     # Can be used for analytics and workflow optimization
@@ -669,12 +1404,12 @@ async def log_agent_response(agent_name: str, response: AgentResponse):
 @app.get("/status")
 async def get_system_status():
     """Get overall system status and metrics"""
-    all_tasks = list(orchestrator.tasks.values())
+    status_counts = orchestrator._status_counts
 
-    total_tasks = len(all_tasks)
-    completed_tasks = sum(1 for t in all_tasks if t.status == "completed")
-    pending_tasks = sum(1 for t in all_tasks if t.status == "pending")
-    in_progress_tasks = sum(1 for t in all_tasks if t.status == "in_progress")
+    total_tasks = len(orchestrator.tasks)
+    completed_tasks = status_counts["completed"]
+    pending_tasks = status_counts["pending"]
+    in_progress_tasks = status_counts["in_progress"]
 
     return {
         "system_status": "healthy",
@@ -686,24 +1421,36 @@ async def get_system_status():
         "progress_percentage": (completed_tasks / total_tasks * 100)
         if total_tasks > 0
         else 0,
-        "next_tasks": [asdict(task) for task in orchestrator.get_next_tasks()[:3]],
+        "next_tasks": [
+            task.to_view_dict() for task in orchestrator.get_next_tasks(limit=3)
+        ],
     }
 
 
+@app.get("/events")
+async def stream_events():
+    """Stream the next ready tasks as server-sent events on every state change"""
+
+    async def next_task_events():
+        while True:
+            # Take the event before the snapshot so no change slips between them
+            changed = orchestrator._state_changed
+            ready_tasks = orchestrator.get_next_tasks()
+            yield {
+                "event": "next_tasks",
+                "data": orjson.dumps(
+                    [task.to_view_dict() for task in ready_tasks]
+                ).decode(),
+            }
+            await changed.wait()
+
+    return EventSourceResponse(next_task_events())
+
+
 @app.get("/templates")
 async def get_workflow_templates():
     """Get available workflow templates"""
-    return {
-        "templates": orchestrator.workflow_templates,
-        "descriptions": {
-            "new-feature": "Complete feature development from requirements to deployment",
-            "mvp-development": "Minimal Viable Product development workflow",
-            "bug-fix": "Bug investigation, fixing, and validation workflow",
-            "performance-optimization": "System performance analysis and optimization",
-            "security-audit": "Comprehensive security assessment and remediation",
-            "refactoring": "Code refactoring with proper testing and validation",
-        },
-    }
+    return Response(orchestrator._templates_json, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -712,4 +1459,16 @@ if __name__ == "__main__":
     print("🚀 AI Development Team Orchestrator starting...")
     print("📊 Dashboard: http://localhost:8000")
     print("📚 API Docs: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Workers only share orchestrator state through Redis, so default to a
+    # single worker unless REDIS_URL is configured
+    default_workers = (os.cpu_count() or 1) if os.environ.get("REDIS_URL") else 1
+    # Workers import the app by name, so pass this module's real import path
+    # (e.g. orchestrator.main when launched with python -m)
+    uvicorn.run(
+        f"{__spec__.name}:app" if __spec__ else "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", default_workers)),
+    )
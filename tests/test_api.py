@@ -0,0 +1,26 @@
+"""HTTP contract of the orchestrator API"""
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("/workflows", b'{"type": "bug-fix"}'),
+        ("/workflows", b"not json"),
+        ("/tasks/unknown/complete", b'{"output": 1}'),
+        ("/agents/qa/response", b"{}"),
+    ],
+)
+def test_invalid_bodies_return_fastapi_validation_errors(path, body):
+    response = TestClient(app).post(
+        path, content=body, headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["loc"] == ["body"]
+    assert error["type"] == "value_error"
+    assert error["msg"]
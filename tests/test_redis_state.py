@@ -0,0 +1,253 @@
+"""Replication of orchestrator state between workers through a shared Redis"""
+import asyncio
+
+import fakeredis
+import orjson
+import pytest
+import redis
+from fastapi import HTTPException
+
+from main import DevelopmentOrchestrator, RedisStateStore
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def settle():
+    """Give the pub/sub listeners a chance to apply published events"""
+    await asyncio.sleep(0.05)
+
+
+async def attached_worker(server: fakeredis.FakeServer) -> DevelopmentOrchestrator:
+    worker = DevelopmentOrchestrator()
+    await worker.attach_store(RedisStateStore(fakeredis.FakeAsyncRedis(server=server)))
+    return worker
+
+
+async def recorded_events(pubsub) -> list:
+    events = []
+    while True:
+        message = await pubsub.get_message(timeout=0.1)
+        if message is None:
+            return events
+        if message["type"] == "message":
+            events.append(orjson.loads(message["data"]))
+
+
+def snapshot(worker: DevelopmentOrchestrator) -> tuple:
+    return (
+        {task_id: (task.status, task.output) for task_id, task in worker.tasks.items()},
+        [task.id for task in worker.get_next_tasks()],
+        dict(worker._status_counts),
+    )
+
+
+def test_replayed_events_after_load_keep_dependency_order():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        recorder = fakeredis.FakeAsyncRedis(server=server).pubsub()
+        await recorder.subscribe(RedisStateStore.CHANNEL)
+
+        writer = await attached_worker(server)
+        created = await writer.create_workflow("new-feature", "Login")
+        tasks = {
+            writer.tasks[task_id].agent: task_id for task_id in created["task_ids"]
+        }
+
+        async def executor(task):
+            return "done"
+
+        await writer.complete_task(tasks["product-manager"], "requirements")
+        await writer.complete_task(tasks["architect"], "design")
+        frontend = writer.tasks[tasks["frontend-dev"]]
+        await writer.complete_task(
+            frontend.id, await writer._execute_task(frontend, executor)
+        )
+
+        # A worker loading this state afterwards still receives every event
+        # that was buffered while it loaded
+        reader = await attached_worker(server)
+        for event in await recorded_events(recorder):
+            reader.apply_event(event)
+
+        assert [task.agent for task in reader.get_next_tasks()] == ["security"]
+        assert min(reader._indegree.values()) >= 0
+        assert reader.tasks[frontend.id].status == "completed"
+        assert snapshot(reader) == snapshot(writer)
+
+        await recorder.aclose()
+        for worker in (writer, reader):
+            await worker.store.close()
+
+    run(scenario())
+
+
+def test_stale_event_does_not_reopen_completed_task():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker = await attached_worker(server)
+        created = await worker.create_workflow("bug-fix", "Crash on save")
+        task = worker.tasks[created["next_task"]["id"]]
+        await worker.complete_task(task.id, "reproduced")
+
+        stale = {**task.to_view_dict(), "status": "in_progress", "version": 1}
+        worker.apply_event({"op": "task", "task": stale})
+        newer = {**task.to_view_dict(), "status": "in_progress", "version": 5}
+        worker.apply_event({"op": "task", "task": newer})
+
+        assert task.status == "completed"
+        assert worker._status_counts["completed"] == 1
+        assert [t.agent for t in worker.get_next_tasks()] == [
+            "backend-dev",
+            "frontend-dev",
+        ]
+
+        await worker.store.close()
+
+    run(scenario())
+
+
+def test_concurrent_completions_from_two_workers_converge():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        first, second = await attached_worker(server), await attached_worker(server)
+        created = await first.create_workflow("performance-optimization", "Slow API")
+        await settle()
+        task_id = created["next_task"]["id"]
+
+        results = await asyncio.gather(
+            first.complete_task(task_id, "from first"),
+            second.complete_task(task_id, "from second"),
+            return_exceptions=True,
+        )
+        await settle()
+
+        conflicts = [r for r in results if isinstance(r, HTTPException)]
+        assert len(conflicts) == 1 and conflicts[0].status_code == 409
+        assert snapshot(first) == snapshot(second)
+        assert first.tasks[task_id].version == 1
+
+        for worker in (first, second):
+            await worker.store.close()
+
+    run(scenario())
+
+
+def test_restarted_worker_rehydrates_shared_state():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker = await attached_worker(server)
+        created = await worker.create_workflow("refactoring", "Split modules")
+        for workflow_type in ("new-feature", "bug-fix"):
+            await worker.create_workflow(workflow_type, "Queued work")
+
+        async def executor(task):
+            return f"{task.agent} done"
+
+        await worker.run_workflow(created["workflow_id"], executor)
+
+        restarted = await attached_worker(server)
+        assert snapshot(restarted) == snapshot(worker)
+        assert restarted._calculate_workflow_progress(created["workflow_id"])[
+            "progress_percentage"
+        ] == pytest.approx(100)
+
+        for each in (worker, restarted):
+            await each.store.close()
+
+    run(scenario())
+
+
+def test_update_rejected_for_completed_task_is_not_stored():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker = await attached_worker(server)
+        created = await worker.create_workflow("bug-fix", "Crash on save")
+        task = worker.tasks[created["next_task"]["id"]]
+        await worker.complete_task(task.id, "reproduced")
+
+        with pytest.raises(HTTPException) as rejected:
+            await worker._update_task(task, "blocked")
+        assert rejected.value.status_code == 409
+
+        stored = await worker.store.load_task(task.id)
+        assert (stored["status"], stored["version"]) == ("completed", task.version)
+        restarted = await attached_worker(server)
+        assert snapshot(restarted) == snapshot(worker)
+
+        for each in (worker, restarted):
+            await each.store.close()
+
+    run(scenario())
+
+
+def test_listener_resubscribes_and_reloads_after_lost_connection():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        writer, reader = await attached_worker(server), await attached_worker(server)
+        reader.store.RESUBSCRIBE_DELAY = 0.05
+        created = await writer.create_workflow("security-audit", "Yearly audit")
+        await settle()
+
+        async def dropped(*args, **kwargs):
+            raise redis.exceptions.ConnectionError("Connection reset by peer")
+
+        # The next read after the pending message fails, and the following
+        # completion is published while the reader is not subscribed
+        reader.store._pubsub.parse_response = dropped
+        await writer.complete_task(created["next_task"]["id"], "assessed")
+        await asyncio.sleep(0.01)
+        ready = writer.get_next_tasks(limit=1)[0]
+        await writer.complete_task(ready.id, "reviewed")
+        await asyncio.sleep(0.2)
+
+        assert snapshot(reader) == snapshot(writer)
+        assert reader.tasks[ready.id].status == "completed"
+
+        for worker in (writer, reader):
+            await worker.store.close()
+
+    run(scenario())
+
+
+def test_task_event_during_read_through_is_applied_after_load():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        recorder = fakeredis.FakeAsyncRedis(server=server).pubsub()
+        await recorder.subscribe(RedisStateStore.CHANNEL)
+        writer = await attached_worker(server)
+        created = await writer.create_workflow("bug-fix", "Crash on save")
+        task_id = created["next_task"]["id"]
+        await recorded_events(recorder)
+
+        # A worker that missed the workflow reads it through from the store
+        reader = DevelopmentOrchestrator()
+        reader.store = RedisStateStore(fakeredis.FakeAsyncRedis(server=server))
+        snapshot_taken, release = asyncio.Event(), asyncio.Event()
+        load_task_workflow = reader.store.load_task_workflow
+
+        async def slow_load(task_id):
+            loaded = await load_task_workflow(task_id)
+            snapshot_taken.set()
+            await release.wait()
+            return loaded
+
+        reader.store.load_task_workflow = slow_load
+        lookup = asyncio.create_task(reader.find_task(task_id))
+        await snapshot_taken.wait()
+
+        # The task completes after the snapshot but before it is registered
+        await writer.complete_task(task_id, "reproduced")
+        for event in await recorded_events(recorder):
+            reader.apply_event(event)
+        release.set()
+
+        assert (await lookup).status == "completed"
+        assert snapshot(reader) == snapshot(writer)
+
+        await recorder.aclose()
+        await writer.store.close()
+        await reader.store.close()
+
+    run(scenario())
@@ -0,0 +1,144 @@
+"""Ready-task scheduling checked against a brute-force scan of every task"""
+import asyncio
+import random
+from collections import Counter
+
+import pytest
+
+from main import (
+    PRIORITY_RANKS,
+    VECTORIZED_DEPENDENCY_BATCH,
+    DevelopmentOrchestrator,
+    Task,
+)
+
+
+def brute_force_ready(orchestrator: DevelopmentOrchestrator) -> list:
+    ready = [
+        task
+        for task in orchestrator.tasks.values()
+        if task.status == "pending"
+        and all(
+            orchestrator.tasks[dep_id].status == "completed"
+            for dep_id in task.dependencies
+        )
+    ]
+    return [
+        task.id
+        for task in sorted(ready, key=lambda t: (PRIORITY_RANKS[t.priority], t.seq))
+    ]
+
+
+def assert_consistent(orchestrator: DevelopmentOrchestrator, limited_first: bool):
+    expected = brute_force_ready(orchestrator)
+    reads = [
+        lambda: [t.id for t in orchestrator.get_next_tasks(limit=1)] == expected[:1],
+        lambda: [t.id for t in orchestrator.get_next_tasks(limit=3)] == expected[:3],
+        lambda: [t.id for t in orchestrator.get_next_tasks()] == expected,
+    ]
+    for read in reads if limited_first else reversed(reads):
+        assert read()
+    assert orchestrator._ready_stale >= 0
+    assert min(orchestrator._indegree.values(), default=0) >= 0
+
+    counts = Counter(task.status for task in orchestrator.tasks.values())
+    for status in ("pending", "in_progress", "completed", "blocked"):
+        assert orchestrator._status_counts[status] == counts[status]
+    for workflow_id, workflow in orchestrator.workflows.items():
+        progress = orchestrator._calculate_workflow_progress(workflow_id)
+        assert progress["completed_tasks"] == sum(
+            orchestrator.tasks[task_id].status == "completed"
+            for task_id in workflow["task_ids"]
+        )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_ready_tasks_match_brute_force(seed):
+    rng = random.Random(seed)
+
+    async def scenario():
+        orchestrator = DevelopmentOrchestrator()
+        templates = list(orchestrator.workflow_templates)
+        for _ in range(200):
+            roll = rng.random()
+            ready = brute_force_ready(orchestrator)
+            if roll < 0.1 or not orchestrator.tasks:
+                await orchestrator.create_workflow(rng.choice(templates), "Fuzz")
+            elif roll < 0.6 and ready:
+                await orchestrator.complete_task(ready[0], "done")
+            elif roll < 0.8:
+                # Force-complete any task, whatever its status or dependencies
+                await orchestrator.complete_task(
+                    rng.choice(list(orchestrator.tasks)), "forced"
+                )
+            elif ready:
+                task = orchestrator.tasks[rng.choice(ready)]
+                await orchestrator._update_task(
+                    task, rng.choice(["in_progress", "blocked"])
+                )
+            assert_consistent(orchestrator, limited_first=rng.random() < 0.5)
+
+    asyncio.run(scenario())
+
+
+def test_bulk_registration_counts_match_per_workflow_registration():
+    rng = random.Random(7)
+
+    async def saved_state():
+        source = DevelopmentOrchestrator()
+        templates = list(source.workflow_templates)
+        while len(source.tasks) <= 2 * VECTORIZED_DEPENDENCY_BATCH:
+            await source.create_workflow(rng.choice(templates), "Bulk")
+        for task_id in rng.sample(list(source.tasks), len(source.tasks) // 2):
+            await source.complete_task(task_id, "done")
+        return [
+            (
+                workflow,
+                [
+                    Task(**source.tasks[task_id].to_view_dict())
+                    for task_id in workflow["task_ids"]
+                ],
+            )
+            for workflow in source.workflows.values()
+        ]
+
+    loaded = asyncio.run(saved_state())
+    assert sum(len(tasks) for _, tasks in loaded) >= VECTORIZED_DEPENDENCY_BATCH
+
+    bulk = DevelopmentOrchestrator()
+    bulk._register_workflows(loaded)
+    one_by_one = DevelopmentOrchestrator()
+    for workflow, tasks in loaded:
+        one_by_one._register_workflow(
+            workflow, [Task(**task.to_view_dict()) for task in tasks]
+        )
+
+    assert bulk._indegree == one_by_one._indegree
+    assert bulk._indegree == {
+        task.id: sum(
+            bulk.tasks[dep_id].status != "completed" for dep_id in task.dependencies
+        )
+        for task in bulk.tasks.values()
+    }
+    assert [t.id for t in bulk.get_next_tasks()] == brute_force_ready(bulk)
+    assert [t.id for t in bulk.get_next_tasks()] == [
+        t.id for t in one_by_one.get_next_tasks()
+    ]
+
+
+def test_executor_failure_survives_a_rejected_blocked_write():
+    async def scenario():
+        orchestrator = DevelopmentOrchestrator()
+        created = await orchestrator.create_workflow("bug-fix", "Crash on save")
+        task = orchestrator.tasks[created["next_task"]["id"]]
+
+        async def executor(running):
+            # The task is completed over HTTP while the executor runs
+            await orchestrator.complete_task(running.id, "fixed elsewhere")
+            raise RuntimeError("executor crashed")
+
+        with pytest.raises(RuntimeError, match="executor crashed"):
+            await orchestrator.run_workflow(created["workflow_id"], executor)
+        assert task.status == "completed"
+
+    asyncio.run(scenario())